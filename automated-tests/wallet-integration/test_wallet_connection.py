@@ -5,127 +5,548 @@ Tests wallet connection, transaction signing, and contract interactions
 """
 
 import asyncio
+import atexit
+import contextlib
 import json
+import logging
+import logging.handlers
+import os
+import queue
+import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from web3 import Web3
 from eth_account import Account
+from eth_hash.auto import keccak
 import pytest
 import requests
 from selenium import webdriver
+from selenium.webdriver import Remote
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import TimeoutException
+
+import aiohttp
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Test output is queued so concurrent tests never contend on stdout; a single
+# listener per process drains it from the first tester until interpreter exit
+logger = logging.getLogger('lithos.tests')
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.Queue(-1)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+logger.addHandler(_queue_handler)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener_lock = threading.Lock()
+_log_listener_started = False
+
+class _TestOutputBuffer(logging.Filter):
+    """Hold back a thread's records while it runs a test so concurrent output stays grouped"""
+    
+    def __init__(self):
+        super().__init__()
+        self._local = threading.local()
+        self._flush_lock = threading.Lock()
+    
+    def filter(self, record):
+        records = getattr(self._local, "records", None)
+        if records is None:
+            return True
+        records.append(record)
+        return False
+    
+    @contextlib.contextmanager
+    def capture(self):
+        """Buffer records logged by this thread and emit them together on exit"""
+        self._local.records = records = []
+        try:
+            yield
+        finally:
+            self._local.records = None
+            with self._flush_lock:
+                for record in records:
+                    _queue_handler.handle(record)
+
+_TEST_OUTPUT = _TestOutputBuffer()
+logger.addFilter(_TEST_OUTPUT)
+
+def _start_log_listener():
+    """Start the stdout listener once per process and stop it at exit"""
+    global _log_listener_started
+    with _log_listener_lock:
+        if not _log_listener_started:
+            _log_listener.start()
+            atexit.register(_log_listener.stop)
+            _log_listener_started = True
+
+# The report lands in automated-tests/ unless overridden
+REPORT_PATH = os.environ.get(
+    "LITHOS_TEST_REPORT_PATH",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "wallet_integration_report.json")
+)
+
+# Opt in to concurrent single RPCs for nodes that serialize batch requests;
+# by default network info is one batch over the keep-alive requests session
+CONCURRENT_RPC = os.environ.get("LITHOS_CONCURRENT_RPC") == "1"
+
+# Result recorded for tests that could not run in this environment
+SKIPPED = "SKIPPED"
+
+# Transaction constants shared by the signing tests
+VALUE_WEI = Web3.to_wei(0.001, 'ether')
+GAS_PRICE_WEI = Web3.to_wei(20, 'gwei')
+
+TRANSACTION_TEMPLATE = {
+    'to': '0x0000000000000000000000000000000000000000',
+    'value': VALUE_WEI,
+    'gas': 21000,
+    'gasPrice': GAS_PRICE_WEI,
+    'nonce': 0,
+    'chainId': 1337  # Local testnet
+}
+
+# Prefer the frontend's test hook, falling back to matching the button text
+CONNECT_WALLET_SELECTOR = (By.CSS_SELECTOR, '[data-testid="connect-wallet"]')
+CONNECT_WALLET_XPATH = (By.XPATH, "//button[contains(text(), 'Connect Wallet')]")
+
+MARKETPLACE_ELEMENTS = (
+    "Marketplace",
+    "Game Assets",
+    "Rare Collectibles",
+    "True Ownership"
+)
+
+# Multi-pattern matchers that scan the page source once for every marketplace element
+_MARKETPLACE_RE = re.compile("|".join(map(re.escape, MARKETPLACE_ELEMENTS)))
+
+if ahocorasick is not None:
+    _MARKETPLACE_AUTOMATON = ahocorasick.Automaton()
+    for _element in MARKETPLACE_ELEMENTS:
+        _MARKETPLACE_AUTOMATON.add_word(_element, _element)
+    _MARKETPLACE_AUTOMATON.make_automaton()
+else:
+    _MARKETPLACE_AUTOMATON = None
+
+def _find_marketplace_elements(page_source):
+    """Return the marketplace elements present in page_source in a single pass"""
+    if _MARKETPLACE_AUTOMATON is not None:
+        return {element for _, element in _MARKETPLACE_AUTOMATON.iter(page_source)}
+    return set(_MARKETPLACE_RE.findall(page_source))
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Syntactic address check, avoiding Web3.is_address's checksum machinery
+_ADDR_RE = re.compile(r'0x[0-9a-fA-F]{40}')
+
+# Selectors for the functions the tests call are hashed once at import
+SELECTOR_CACHE = {
+    sig: keccak(sig.encode())[:4]
+    for sig in (
+        "registerPlayer()",
+        "getPlayerData(address)",
+        "aggregate3((address,bool,bytes)[])"
+    )
+}
+
+def selector(sig):
+    """Return the 4-byte function selector for a signature, hashing it only once"""
+    s = SELECTOR_CACHE.get(sig)
+    if s is None:
+        s = keccak(sig.encode())[:4]
+        SELECTOR_CACHE[sig] = s
+    return s
+
+def _make_account(_):
+    """Create a throwaway account and return its private key"""
+    return Account.create().key
+
+def _sign_transaction(private_key, nonce):
+    """Sign the shared transaction template at the given nonce and return its hash"""
+    return Account.sign_transaction({**TRANSACTION_TEMPLATE, 'nonce': nonce}, private_key).hash
+
+# Each setup takes one account, so a single spare keeps keygen off the setup
+# path without leaving background work competing with the tests
+_ACCOUNT_POOL = queue.Queue(maxsize=1)
+_account_pool_lock = threading.Lock()
+_account_pool_thread = None
+
+def _fill_account_pool():
+    """Keep one spare test account ready"""
+    while True:
+        _ACCOUNT_POOL.put(Account.create())
+
+def _start_account_pool():
+    """Start the background account producer once per process"""
+    global _account_pool_thread
+    with _account_pool_lock:
+        if _account_pool_thread is None:
+            _account_pool_thread = threading.Thread(target=_fill_account_pool, name="lithos-account-pool", daemon=True)
+            _account_pool_thread.start()
+
+# Reuse one Chrome session across runs (e.g. a whole CI job) instead of starting chromedriver each time
+REUSE_CHROME = os.environ.get("LITHOS_REUSE_CHROME") == "1"
+SELENIUM_SESSION_FILE = os.environ.get(
+    "LITHOS_SELENIUM_SESSION_FILE",
+    os.path.join(os.path.expanduser("~"), ".cache", "lithos", "selenium_session.json")
+)
+
+class ReuseChrome(Remote):
+    """Remote driver that adopts an existing browser session instead of creating one"""
+    
+    def __init__(self, command_executor, session_id):
+        self._reused_session_id = session_id
+        super().__init__(command_executor=command_executor, options=Options())
+    
+    def start_session(self, capabilities, *args, **kwargs):
+        self.session_id = self._reused_session_id
+        self.caps = {}
+
+def _chrome_options():
+    """Headless Chrome options for frontend testing"""
+    chrome_options = Options()
+    chrome_options.add_argument("--headless")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    return chrome_options
+
+def _reuse_recorded_session():
+    """Adopt the Chrome session recorded by an earlier run, if it is still alive"""
+    try:
+        with open(SELENIUM_SESSION_FILE) as f:
+            session = json.load(f)
+        driver = ReuseChrome(session["executor_url"], session["session_id"])
+        driver.current_url
+        return driver
+    except Exception:
+        return None
+
+def _executor_url(driver):
+    """Return the address of the WebDriver server behind a driver"""
+    connection = driver.command_executor
+    client_config = getattr(connection, "_client_config", None)
+    if client_config is not None:
+        return client_config.remote_server_addr
+    return connection._url
+
+def _record_session(driver):
+    """Persist a driver's executor URL and session ID for later runs to adopt"""
+    os.makedirs(os.path.dirname(SELENIUM_SESSION_FILE), exist_ok=True)
+    fd = os.open(SELENIUM_SESSION_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, 'w') as f:
+        json.dump({
+            "executor_url": _executor_url(driver),
+            "session_id": driver.session_id
+        }, f)
+
+def _new_chrome_driver():
+    """Start a headless Chrome driver, adopting a recorded session in reuse mode"""
+    if REUSE_CHROME:
+        driver = _reuse_recorded_session()
+        if driver is not None:
+            return driver
+    
+    driver = webdriver.Chrome(options=_chrome_options())
+    
+    if REUSE_CHROME:
+        try:
+            _record_session(driver)
+        except Exception:
+            driver.quit()
+            raise
+        # Detach chromedriver so it outlives this process for the next run to adopt
+        driver.service.process = None
+    
+    return driver
+
+class DriverPool:
+    """Pool of warm Chrome drivers shared by tester instances in one process"""
+    
+    def __init__(self, factory, size=2, quit_drivers=True):
+        self._factory = factory
+        self._size = size
+        # Reused sessions must outlive this process, so their handles are only dropped
+        self._quit_drivers = quit_drivers
+        self._idle = queue.Queue(maxsize=max(size, 0))
+        self._warm_thread = None
+    
+    def warm(self, count=None):
+        """Start up to count drivers (default: the pool size) on a background thread"""
+        count = self._size if count is None else min(count, self._size)
+        if count <= 0 or self._warm_thread is not None:
+            return
+        
+        def start_drivers():
+            for _ in range(count):
+                try:
+                    driver = self._factory()
+                except Exception:
+                    return
+                try:
+                    self._idle.put_nowait(driver)
+                except queue.Full:
+                    self._discard(driver)
+                    return
+        
+        self._warm_thread = threading.Thread(target=start_drivers, name="lithos-driver-warmup", daemon=True)
+        self._warm_thread.start()
+    
+    def _take_idle(self):
+        """Pop an idle driver, waiting on an in-progress warm-up rather than starting a duplicate"""
+        while True:
+            try:
+                return self._idle.get_nowait()
+            except queue.Empty:
+                if self._warm_thread is None or not self._warm_thread.is_alive():
+                    return None
+            try:
+                return self._idle.get(timeout=0.1)
+            except queue.Empty:
+                continue
+    
+    def acquire(self):
+        """Return a live idle driver, starting a new one only if none is available"""
+        while True:
+            driver = self._take_idle()
+            if driver is None:
+                return self._factory()
+            if self._is_alive(driver):
+                return driver
+            self._discard(driver)
+    
+    def release(self, driver):
+        """Reset a driver and return it to the pool, discarding it if pooling is off or the pool is full"""
+        if self._size <= 0:
+            self._discard(driver)
+            return
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            self._idle.put_nowait(driver)
+        except Exception:
+            self._discard(driver)
+    
+    def close(self):
+        """Discard every idle driver"""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(driver)
+    
+    @staticmethod
+    def _is_alive(driver):
+        """Detect drivers whose browser or devtools socket has gone away"""
+        try:
+            driver.current_url
+            return True
+        except Exception:
+            return False
+    
+    def _discard(self, driver):
+        if not self._quit_drivers:
+            return
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+def _driver_pool_size(default=2):
+    """Read LITHOS_DRIVER_POOL_SIZE, falling back to the default when unset or invalid"""
+    try:
+        return int(os.environ.get("LITHOS_DRIVER_POOL_SIZE", default))
+    except ValueError:
+        return default
+
+DRIVER_POOL = DriverPool(_new_chrome_driver, size=_driver_pool_size(), quit_drivers=not REUSE_CHROME)
+atexit.register(DRIVER_POOL.close)
 
 class WalletIntegrationTester:
     def __init__(self, rpc_url="http://localhost:8545", frontend_url="http://localhost:5173"):
         self.rpc_url = rpc_url
         self.frontend_url = frontend_url
-        self.web3 = Web3(Web3.HTTPProvider(rpc_url))
+        
+        # Share one keep-alive connection pool across every RPC call
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=1)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self.web3 = Web3(Web3.HTTPProvider(rpc_url, session=self._session))
         self.test_account = None
         self.driver = None
+        self._frontend_loaded = False
+        _start_log_listener()
         
     def setup_test_environment(self):
         """Set up test environment with local blockchain and test accounts"""
-        print("🔧 Setting up test environment...")
+        logger.info("🔧 Setting up test environment...")
         
-        # Create test account
-        self.test_account = Account.create()
-        print(f"✅ Created test account: {self.test_account.address}")
-        
-        # Setup Chrome driver for frontend testing
-        chrome_options = Options()
-        chrome_options.add_argument("--headless")
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
+        # Generate the test account in the background while Chrome starts
+        _start_account_pool()
         
+        # Borrow a Chrome driver for frontend testing
         try:
-            self.driver = webdriver.Chrome(options=chrome_options)
-            print("✅ Chrome driver initialized")
+            self.driver = DRIVER_POOL.acquire()
+            logger.info("✅ Chrome driver initialized")
         except Exception as e:
-            print(f"⚠️  Chrome driver not available: {e}")
+            logger.info(f"⚠️  Chrome driver not available: {e}")
             self.driver = None
+        
+        # Take the pre-generated test account, creating one inline if it is not ready yet
+        try:
+            self.test_account = _ACCOUNT_POOL.get(timeout=1.0)
+        except queue.Empty:
+            self.test_account = Account.create()
+        logger.info(f"✅ Created test account: {self.test_account.address}")
+    
+    def _get_network_info(self):
+        """Fetch chain ID and latest block number as one JSON-RPC batch"""
+        if hasattr(self.web3, "batch_requests"):
+            with self.web3.batch_requests() as batch:
+                batch.add(self.web3.eth.chain_id)
+                batch.add(self.web3.eth.block_number)
+                chain_id, block_number = batch.execute()
+            return chain_id, block_number
+        
+        # Older web3.py has no batching API, so post the JSON-RPC array directly
+        payload = [
+            {"jsonrpc": "2.0", "id": 1, "method": "eth_chainId", "params": []},
+            {"jsonrpc": "2.0", "id": 2, "method": "eth_blockNumber", "params": []}
+        ]
+        response = self._session.post(self.rpc_url, json=payload, timeout=10)
+        response.raise_for_status()
+        replies = {reply["id"]: reply for reply in response.json()}
+        return int(replies[1]["result"], 16), int(replies[2]["result"], 16)
+    
+    async def _rpc(self, session, method, params):
+        """Send a single JSON-RPC request over the given aiohttp session"""
+        payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+        async with session.post(self.rpc_url, json=payload) as response:
+            response.raise_for_status()
+            reply = await response.json()
+        if "error" in reply:
+            raise RuntimeError(f"{method} failed: {reply['error']}")
+        return reply["result"]
+    
+    async def _get_network_info_async(self):
+        """Fetch chain ID, latest block and network ID with concurrent JSON-RPC requests
+        
+        aiohttp sessions are bound to their event loop, so each call opens its own
+        session and pays a fresh connection per request; only worth it on nodes
+        that process batch requests serially.
+        """
+        connector = aiohttp.TCPConnector(limit=8, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=10)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            chain_id, block_number, network_id = await asyncio.gather(
+                self._rpc(session, "eth_chainId", []),
+                self._rpc(session, "eth_blockNumber", []),
+                self._rpc(session, "net_version", [])
+            )
+        return int(chain_id, 16), int(block_number, 16), network_id
     
     def test_web3_connection(self):
         """Test basic Web3 connection"""
-        print("\n🔗 Testing Web3 connection...")
+        logger.info("\n🔗 Testing Web3 connection...")
         
         try:
             # Test connection
             is_connected = self.web3.is_connected()
-            print(f"Web3 connected: {is_connected}")
+            logger.info(f"Web3 connected: {is_connected}")
             
             if is_connected:
-                # Get network info
-                chain_id = self.web3.eth.chain_id
-                block_number = self.web3.eth.block_number
-                print(f"Chain ID: {chain_id}")
-                print(f"Latest block: {block_number}")
+                if CONCURRENT_RPC:
+                    # Get network info with the requests in flight concurrently
+                    chain_id, block_number, network_id = asyncio.run(self._get_network_info_async())
+                    logger.info(f"Network ID: {network_id}")
+                else:
+                    # Get network info in a single round-trip over the warm session
+                    chain_id, block_number = self._get_network_info()
+                logger.info(f"Chain ID: {chain_id}")
+                logger.info(f"Latest block: {block_number}")
                 return True
             else:
-                print("❌ Web3 connection failed")
+                logger.info("❌ Web3 connection failed")
                 return False
                 
         except Exception as e:
-            print(f"❌ Web3 connection error: {e}")
+            logger.info(f"❌ Web3 connection error: {e}")
             return False
     
     def test_account_operations(self):
         """Test account creation and basic operations"""
-        print("\n👤 Testing account operations...")
+        logger.info("\n👤 Testing account operations...")
         
         try:
             # Test account creation
             account = Account.create()
-            print(f"✅ Account created: {account.address}")
+            logger.info(f"✅ Account created: {account.address}")
             
             # Test private key operations
             private_key = account.key.hex()
             recovered_account = Account.from_key(private_key)
             assert account.address == recovered_account.address
-            print("✅ Private key operations working")
+            logger.info("✅ Private key operations working")
             
             # Test message signing
             message = "Test message for LithosProtocol"
             signed_message = account.sign_message(message.encode())
-            print("✅ Message signing working")
+            logger.info("✅ Message signing working")
             
             return True
             
         except Exception as e:
-            print(f"❌ Account operations error: {e}")
+            logger.info(f"❌ Account operations error: {e}")
             return False
     
     def test_transaction_creation(self):
         """Test transaction creation and signing"""
-        print("\n💸 Testing transaction creation...")
+        logger.info("\n💸 Testing transaction creation...")
         
         try:
-            # Create a test transaction
-            transaction = {
-                'to': '0x0000000000000000000000000000000000000000',
-                'value': Web3.to_wei(0.001, 'ether'),
-                'gas': 21000,
-                'gasPrice': Web3.to_wei(20, 'gwei'),
-                'nonce': 0,
-                'chainId': 1337  # Local testnet
-            }
-            
-            # Sign transaction
-            signed_txn = self.test_account.sign_transaction(transaction)
-            print("✅ Transaction signed successfully")
-            print(f"Transaction hash: {signed_txn.hash.hex()}")
+            # Sign the shared test transaction
+            signed_txn = self.test_account.sign_transaction(TRANSACTION_TEMPLATE)
+            logger.info("✅ Transaction signed successfully")
+            logger.info(f"Transaction hash: {signed_txn.hash.hex()}")
             
             return True
             
         except Exception as e:
-            print(f"❌ Transaction creation error: {e}")
+            logger.info(f"❌ Transaction creation error: {e}")
             return False
     
+    def multicall(self, calls):
+        """Execute (target, call_data) view calls as one eth_call through Multicall3
+        
+        Returns the raw return data for each call, or b"" for calls that reverted.
+        """
+        call_data = selector("aggregate3((address,bool,bytes)[])") + self.web3.codec.encode(
+            ["(address,bool,bytes)[]"],
+            [[(target, True, data) for target, data in calls]]
+        )
+        raw = self.web3.eth.call({'to': MULTICALL3_ADDRESS, 'data': call_data})
+        (results,) = self.web3.codec.decode(["(bool,bytes)[]"], raw)
+        return [data if success else b"" for success, data in results]
+    
     def test_contract_interaction_simulation(self):
         """Simulate contract interactions"""
-        print("\n📄 Testing contract interaction simulation...")
+        logger.info("\n📄 Testing contract interaction simulation...")
         
         try:
             # Simulate contract ABI
@@ -150,101 +571,127 @@ class WalletIntegrationTester:
             contract_address = "0x1234567890123456789012345678901234567890"
             
             # Simulate function call data
-            function_selector = Web3.keccak(text="registerPlayer()")[:4]
-            print(f"✅ Function selector generated: {function_selector.hex()}")
+            function_selector = SELECTOR_CACHE["registerPlayer()"]
+            logger.info(f"✅ Function selector generated: {Web3.to_hex(function_selector)}")
             
             # Simulate contract call
             call_data = {
                 'to': contract_address,
-                'data': function_selector.hex()
+                'data': Web3.to_hex(function_selector)
             }
-            print("✅ Contract call data prepared")
+            logger.info("✅ Contract call data prepared")
+            
+            # Batch the player lookups into a single aggregated view call
+            players = [
+                "0x0000000000000000000000000000000000000001",
+                "0x0000000000000000000000000000000000000002",
+                "0x0000000000000000000000000000000000000003"
+            ]
+            calls = [
+                (contract_address, SELECTOR_CACHE["getPlayerData(address)"] + self.web3.codec.encode(["address"], [player]))
+                for player in players
+            ]
+            logger.info(f"✅ Prepared {len(calls)} getPlayerData calls for Multicall3")
+            
+            if self.web3.is_connected() and self.web3.eth.get_code(MULTICALL3_ADDRESS):
+                return_data = self.multicall(calls)
+                assert len(return_data) == len(calls)
+                logger.info(f"✅ Multicall3 returned {len(return_data)} results in one eth_call")
+            else:
+                logger.info("⚠️  Multicall3 not deployed on this network - skipping aggregated call")
             
             return True
             
         except Exception as e:
-            print(f"❌ Contract interaction error: {e}")
+            logger.info(f"❌ Contract interaction error: {e}")
             return False
     
+    def _ensure_frontend(self):
+        """Load the frontend once and share the page across browser tests"""
+        if not self._frontend_loaded:
+            self.driver.get(self.frontend_url)
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.TAG_NAME, "body"))
+            )
+            self._frontend_loaded = True
+    
     def test_frontend_wallet_connection(self):
         """Test frontend wallet connection flow"""
-        print("\n🌐 Testing frontend wallet connection...")
+        logger.info("\n🌐 Testing frontend wallet connection...")
         
         if not self.driver:
-            print("⚠️  Skipping frontend tests - Chrome driver not available")
-            return True
+            logger.info("⚠️  Skipping frontend tests - Chrome driver not available")
+            return SKIPPED
         
         try:
             # Navigate to frontend
-            self.driver.get(self.frontend_url)
-            print(f"✅ Navigated to {self.frontend_url}")
-            
-            # Wait for page to load
-            WebDriverWait(self.driver, 10).until(
-                EC.presence_of_element_located((By.TAG_NAME, "body"))
-            )
+            self._ensure_frontend()
+            logger.info(f"✅ Navigated to {self.frontend_url}")
             
             # Check for connect wallet button
             try:
                 connect_button = WebDriverWait(self.driver, 5).until(
-                    EC.element_to_be_clickable((By.XPATH, "//button[contains(text(), 'Connect Wallet')]"))
+                    EC.any_of(
+                        EC.element_to_be_clickable(CONNECT_WALLET_SELECTOR),
+                        EC.element_to_be_clickable(CONNECT_WALLET_XPATH)
+                    )
                 )
-                print("✅ Connect Wallet button found")
+                logger.info("✅ Connect Wallet button found")
                 
                 # Check page title
                 title = self.driver.title
                 assert "LithosProtocol" in title
-                print(f"✅ Page title correct: {title}")
+                logger.info(f"✅ Page title correct: {title}")
                 
             except Exception as e:
-                print(f"⚠️  Connect button not found: {e}")
+                logger.info(f"⚠️  Connect button not found: {e}")
             
             return True
             
         except Exception as e:
-            print(f"❌ Frontend test error: {e}")
+            logger.info(f"❌ Frontend test error: {e}")
             return False
     
     def test_marketplace_functionality(self):
         """Test marketplace frontend functionality"""
-        print("\n🏪 Testing marketplace functionality...")
+        logger.info("\n🏪 Testing marketplace functionality...")
         
         if not self.driver:
-            print("⚠️  Skipping marketplace tests - Chrome driver not available")
-            return True
+            logger.info("⚠️  Skipping marketplace tests - Chrome driver not available")
+            return SKIPPED
         
         try:
             # Check for marketplace elements
-            self.driver.get(self.frontend_url)
+            self._ensure_frontend()
             
-            # Wait for content to load
-            time.sleep(2)
+            # Wait for marketplace content to render
+            try:
+                WebDriverWait(self.driver, 5).until(EC.any_of(
+                    EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Marketplace')]")),
+                    EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'Game Assets')]"))
+                ))
+            except TimeoutException:
+                logger.info("⚠️  Marketplace content did not appear within 5 seconds")
             
             # Check for key marketplace elements
             page_source = self.driver.page_source
+            found = _find_marketplace_elements(page_source)
             
-            marketplace_elements = [
-                "Marketplace",
-                "Game Assets",
-                "Rare Collectibles",
-                "True Ownership"
-            ]
-            
-            for element in marketplace_elements:
-                if element in page_source:
-                    print(f"✅ Found marketplace element: {element}")
+            for element in MARKETPLACE_ELEMENTS:
+                if element in found:
+                    logger.info(f"✅ Found marketplace element: {element}")
                 else:
-                    print(f"⚠️  Missing marketplace element: {element}")
+                    logger.info(f"⚠️  Missing marketplace element: {element}")
             
             return True
             
         except Exception as e:
-            print(f"❌ Marketplace test error: {e}")
+            logger.info(f"❌ Marketplace test error: {e}")
             return False
     
     def test_sdk_integration(self):
         """Test SDK integration and functionality"""
-        print("\n🔧 Testing SDK integration...")
+        logger.info("\n🔧 Testing SDK integration...")
         
         try:
             # Test SDK configuration
@@ -257,62 +704,59 @@ class WalletIntegrationTester:
                 }
             }
             
-            print("✅ SDK configuration prepared")
+            logger.info("✅ SDK configuration prepared")
             
             # Test contract address validation
             for name, address in sdk_config["contracts"].items():
-                if Web3.is_address(address):
-                    print(f"✅ Valid contract address for {name}: {address}")
+                if isinstance(address, str) and _ADDR_RE.fullmatch(address):
+                    logger.info(f"✅ Valid contract address for {name}: {address}")
                 else:
-                    print(f"❌ Invalid contract address for {name}: {address}")
+                    logger.info(f"❌ Invalid contract address for {name}: {address}")
             
             return True
             
         except Exception as e:
-            print(f"❌ SDK integration error: {e}")
+            logger.info(f"❌ SDK integration error: {e}")
             return False
     
     def run_performance_tests(self):
         """Run performance tests for wallet operations"""
-        print("\n⚡ Running performance tests...")
+        logger.info("\n⚡ Running performance tests...")
         
         try:
-            # Test account creation performance
-            start_time = time.time()
-            accounts = []
-            for i in range(10):
-                account = Account.create()
-                accounts.append(account)
-            
-            creation_time = time.time() - start_time
-            print(f"✅ Created 10 accounts in {creation_time:.3f} seconds")
-            
-            # Test transaction signing performance
-            start_time = time.time()
-            transaction = {
-                'to': '0x0000000000000000000000000000000000000000',
-                'value': Web3.to_wei(0.001, 'ether'),
-                'gas': 21000,
-                'gasPrice': Web3.to_wei(20, 'gwei'),
-                'nonce': 0,
-                'chainId': 1337
-            }
-            
-            for account in accounts:
-                signed_txn = account.sign_transaction(transaction)
-            
-            signing_time = time.time() - start_time
-            print(f"✅ Signed 10 transactions in {signing_time:.3f} seconds")
+            # Threads rather than processes: at this batch size worker process startup
+            # (each re-importing web3 and selenium) costs far more than the keygen itself
+            with ThreadPoolExecutor(max_workers=min(10, os.cpu_count() or 1)) as executor:
+                # Test account creation performance
+                start_time = time.time()
+                account_keys = list(executor.map(_make_account, range(10)))
+                
+                creation_time = time.time() - start_time
+                logger.info(f"✅ Created 10 accounts in {creation_time:.3f} seconds")
+                
+                # Test transaction signing performance across a nonce sweep
+                start_time = time.time()
+                signed_hashes = list(executor.map(_sign_transaction, account_keys, range(len(account_keys))))
+                
+                signing_time = time.time() - start_time
+            logger.info(f"✅ Signed 10 transactions in {signing_time:.3f} seconds")
             
             return True
             
         except Exception as e:
-            print(f"❌ Performance test error: {e}")
+            logger.info(f"❌ Performance test error: {e}")
             return False
     
     def generate_test_report(self, results):
         """Generate comprehensive test report"""
-        print("\n📊 Generating test report...")
+        logger.info("\n📊 Generating test report...")
+        
+        passed = skipped = 0
+        for result in results.values():
+            if result == SKIPPED:
+                skipped += 1
+            elif result:
+                passed += 1
         
         report = {
             "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -324,32 +768,56 @@ class WalletIntegrationTester:
             "test_results": results,
             "summary": {
                 "total_tests": len(results),
-                "passed": sum(1 for r in results.values() if r),
-                "failed": sum(1 for r in results.values() if not r)
+                "passed": passed,
+                "skipped": skipped,
+                "failed": len(results) - passed - skipped
             }
         }
         
         # Save report to file
-        with open('/home/ubuntu/AetheriumPrime/automated-tests/wallet_integration_report.json', 'w') as f:
-            json.dump(report, f, indent=2)
+        if orjson is not None:
+            with open(REPORT_PATH, 'wb') as f:
+                f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            with open(REPORT_PATH, 'w') as f:
+                json.dump(report, f, indent=2)
         
-        print(f"✅ Test report saved")
-        print(f"📈 Summary: {report['summary']['passed']}/{report['summary']['total']} tests passed")
+        logger.info(f"✅ Test report saved")
+        logger.info(f"📈 Summary: {report['summary']['passed']}/{report['summary']['total_tests']} tests passed, {report['summary']['skipped']} skipped")
         
         return report
     
     def cleanup(self):
         """Clean up test environment"""
-        print("\n🧹 Cleaning up test environment...")
+        logger.info("\n🧹 Cleaning up test environment...")
         
         if self.driver:
-            self.driver.quit()
-            print("✅ Chrome driver closed")
+            DRIVER_POOL.release(self.driver)
+            self.driver = None
+            self._frontend_loaded = False
+            logger.info("✅ Chrome driver returned to pool")
+        
+        self._session.close()
+    
+    def _run_test(self, test_name, test_method):
+        """Run a single test method and report its status with its output grouped"""
+        with _TEST_OUTPUT.capture():
+            try:
+                result = test_method()
+                if result == SKIPPED:
+                    status = "⏭️  SKIPPED"
+                else:
+                    status = "✅ PASSED" if result else "❌ FAILED"
+                logger.info(f"\n{status}: {test_name}")
+                return result
+            except Exception as e:
+                logger.info(f"\n❌ FAILED: {test_name} - {e}")
+                return False
     
     def run_all_tests(self):
         """Run all wallet integration tests"""
-        print("🚀 Starting LithosProtocol Wallet Integration Tests")
-        print("=" * 60)
+        logger.info("🚀 Starting LithosProtocol Wallet Integration Tests")
+        logger.info("=" * 60)
         
         # Setup
         self.setup_test_environment()
@@ -357,26 +825,40 @@ class WalletIntegrationTester:
         # Run tests
         results = {}
         
-        test_methods = [
+        # Tests with no shared state run concurrently so their RPC waits overlap
+        independent_tests = [
             ("Web3 Connection", self.test_web3_connection),
             ("Account Operations", self.test_account_operations),
             ("Transaction Creation", self.test_transaction_creation),
             ("Contract Interaction", self.test_contract_interaction_simulation),
+            ("SDK Integration", self.test_sdk_integration)
+        ]
+        
+        # Browser tests share self.driver and timings must not be skewed by load
+        serial_tests = [
             ("Frontend Connection", self.test_frontend_wallet_connection),
             ("Marketplace Functionality", self.test_marketplace_functionality),
-            ("SDK Integration", self.test_sdk_integration),
             ("Performance Tests", self.run_performance_tests)
         ]
         
-        for test_name, test_method in test_methods:
-            try:
-                result = test_method()
-                results[test_name] = result
-                status = "✅ PASSED" if result else "❌ FAILED"
-                print(f"\n{status}: {test_name}")
-            except Exception as e:
-                results[test_name] = False
-                print(f"\n❌ FAILED: {test_name} - {e}")
+        with ThreadPoolExecutor(max_workers=6) as executor:
+            futures = {
+                executor.submit(self._run_test, test_name, test_method): test_name
+                for test_name, test_method in independent_tests
+            }
+            for future in as_completed(futures):
+                results[futures[future]] = future.result()
+        
+        # Keep the report in declaration order regardless of completion order
+        results = {test_name: results[test_name] for test_name, _ in independent_tests}
+        
+        for test_name, test_method in serial_tests:
+            # Don't even dispatch browser tests when there is no driver
+            if test_name.startswith(("Frontend", "Marketplace")) and self.driver is None:
+                results[test_name] = SKIPPED
+                logger.info(f"\n⏭️  SKIPPED: {test_name}")
+                continue
+            results[test_name] = self._run_test(test_name, test_method)
         
         # Generate report
         report = self.generate_test_report(results)
@@ -384,13 +866,15 @@ class WalletIntegrationTester:
         # Cleanup
         self.cleanup()
         
-        print("\n" + "=" * 60)
-        print("🏁 Wallet Integration Tests Complete")
+        logger.info("\n" + "=" * 60)
+        logger.info("🏁 Wallet Integration Tests Complete")
         
         return report
 
 def main():
     """Main test runner"""
+    # Start Chrome in the background while the tester and its RPC session come up
+    DRIVER_POOL.warm(1)
     tester = WalletIntegrationTester()
     report = tester.run_all_tests()
     